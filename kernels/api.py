@@ -20,6 +20,7 @@ from kernels.common.types import (
     KernelRequest,
     KernelReceipt,
     KernelState,
+    ReceiptError,
     ReceiptStatus,
     ToolCall,
     VirtualClock,
@@ -98,6 +99,7 @@ __all__ = [
     "KernelRequest",
     "KernelReceipt",
     "KernelState",
+    "ReceiptError",
     "ReceiptStatus",
     "ToolCall",
     "VirtualClock",
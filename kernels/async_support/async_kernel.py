@@ -72,7 +72,7 @@ class AsyncBaseKernel:
 
         try:
             # Check if halted
-            if self.state == KernelState.HALTED:
+            if self.state is KernelState.HALTED:
                 raise StateError("Kernel is halted")
 
             # VALIDATING
@@ -4,7 +4,7 @@ The audit ledger maintains a hash-chained sequence of entries. Each entry
 includes the hash of the previous entry, ensuring tamper detection.
 """
 
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 
 from kernels.common.types import (
     AuditEntry,
@@ -40,6 +40,9 @@ class AuditLedger:
         self._entries: list[AuditEntry] = []
         self._last_hash = genesis_hash()
         self._next_seq = 0  # Monotonic sequence counter for deterministic ordering
+        # Cached immutable view of _entries; rebuilt lazily after appends
+        # so repeated exports do not re-copy an unchanged ledger
+        self._snapshot: Optional[tuple[AuditEntry, ...]] = None
 
     @property
     def kernel_id(self) -> str:
@@ -54,7 +57,9 @@ class AuditLedger:
     @property
     def entries(self) -> tuple[AuditEntry, ...]:
         """Return all entries as an immutable tuple."""
-        return tuple(self._entries)
+        if self._snapshot is None:
+            self._snapshot = tuple(self._entries)
+        return self._snapshot
 
     @property
     def root_hash(self) -> str:
@@ -183,12 +188,48 @@ class AuditLedger:
             self._entries.append(entry)
             self._last_hash = entry_hash
             self._next_seq += 1  # Increment sequence counter
+            self._snapshot = None  # Invalidate cached view
 
             return entry
 
         except Exception as e:
             raise AuditError(f"Failed to append audit entry: {e}")
 
+    def clone(self) -> "AuditLedger":
+        """Create an independent copy of this ledger.
+
+        The copy shares the immutable entries but has its own chain
+        state, so appends to either ledger do not affect the other.
+        Useful for fork/branch scenarios and for reusing a pre-seeded
+        ledger across tests without recomputing the hash chain.
+
+        Returns:
+            A new AuditLedger with the same entries and root hash.
+        """
+        copy = AuditLedger(self._kernel_id, self._variant)
+        copy._entries = list(self._entries)
+        copy._last_hash = self._last_hash
+        copy._next_seq = self._next_seq
+        return copy
+
+    def restore(self, entries: Sequence[AuditEntry]) -> None:
+        """Restore pre-verified entries into the ledger in bulk.
+
+        Used when rebuilding a ledger from an evidence bundle. Entries
+        must already be hash-chained and sorted by ledger_seq; the chain
+        state is advanced to the last entry in one step rather than per
+        append.
+
+        Args:
+            entries: Chained entries in ledger_seq order.
+        """
+        if not entries:
+            return
+        self._entries.extend(entries)
+        self._last_hash = entries[-1].entry_hash
+        self._next_seq = entries[-1].ledger_seq + 1
+        self._snapshot = None
+
     def export(self, ts_ms: int) -> EvidenceBundle:
         """Export the ledger as an evidence bundle.
 
@@ -199,7 +240,7 @@ class AuditLedger:
             EvidenceBundle containing all entries and verification data.
         """
         return EvidenceBundle(
-            ledger_entries=tuple(self._entries),
+            ledger_entries=self.entries,
             root_hash=self._last_hash,
             exported_at_ms=ts_ms,
             kernel_id=self._kernel_id,
@@ -7,6 +7,7 @@ from kernels.common.types import (
     KernelRequest,
     KernelReceipt,
     KernelState,
+    ReceiptError,
     ReceiptStatus,
     ToolCall,
     AuditEntry,
@@ -29,6 +30,7 @@ __all__ = [
     "KernelRequest",
     "KernelReceipt",
     "KernelState",
+    "ReceiptError",
     "ReceiptStatus",
     "ToolCall",
     "AuditEntry",
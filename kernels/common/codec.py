@@ -7,6 +7,13 @@ hashing and reproducible behavior across platforms.
 import json
 from typing import Any, Optional
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 def serialize_deterministic(data: Any) -> str:
     """Serialize data to JSON with deterministic ordering.
@@ -26,6 +33,54 @@ def serialize_deterministic(data: Any) -> str:
     return json.dumps(data, sort_keys=True, separators=(",", ":"))
 
 
+def _contains_float(obj: Any) -> bool:
+    """Check whether any value in a payload is a float."""
+    if isinstance(obj, float):
+        return True
+    if isinstance(obj, dict):
+        return any(_contains_float(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_contains_float(value) for value in obj)
+    return False
+
+
+def serialize_deterministic_bytes(data: Any) -> bytes:
+    """Serialize data to canonical JSON bytes for hashing.
+
+    Uses orjson's native encoder when available. The fast path is taken
+    only when its output is byte-identical to
+    serialize_deterministic().encode(); payloads the encoders format
+    differently fall back to the stdlib path, so hashes stay stable
+    regardless of which encoder is installed. That rules out non-ASCII
+    strings (stdlib escapes them, orjson does not), DEL characters
+    (stdlib escapes U+007F as \\u007f, orjson emits the raw byte,
+    which still passes the isascii() check), and any float (the
+    encoders disagree on exponent formatting, e.g. "1e-07" vs "1e-7",
+    and on NaN/Infinity, which stdlib emits literally but orjson turns
+    into null).
+
+    Args:
+        data: Data to serialize. Must be JSON-serializable.
+
+    Returns:
+        Canonical JSON bytes with sorted keys and no extra whitespace.
+
+    Raises:
+        TypeError: If data is not JSON-serializable.
+    """
+    if HAS_ORJSON and not _contains_float(data):
+        try:
+            encoded = orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            pass  # orjson is stricter than stdlib json; fall back
+        else:
+            # A raw 0x7f byte can only be an unescaped DEL, which the
+            # stdlib form would have written as \u007f
+            if encoded.isascii() and b"\x7f" not in encoded:
+                return encoded
+    return serialize_deterministic(data).encode("utf-8")
+
+
 def deserialize(data: str) -> Any:
     """Deserialize JSON string to Python object.
 
@@ -7,7 +7,19 @@ produce consistent outputs for identical inputs across all platforms.
 import hashlib
 from typing import Any
 
-from kernels.common.codec import serialize_deterministic
+from kernels.common.codec import serialize_deterministic_bytes
+
+try:
+    import msgpack
+
+    HAS_MSGPACK = True
+except ImportError:
+    HAS_MSGPACK = False
+
+# Shared base context: cloning an initialized sha256 object with .copy()
+# is cheaper than constructing one from scratch per chain entry, and
+# keeps hashing on hashlib's OpenSSL backend (SHA-NI where the CPU has it)
+_SHA256_BASE = hashlib.sha256()
 
 
 def compute_hash(data: bytes, algorithm: str = "sha256") -> str:
@@ -41,21 +53,46 @@ def compute_hash_str(text: str, algorithm: str = "sha256") -> str:
     return compute_hash(text.encode("utf-8"), algorithm)
 
 
+def _sort_keys_deep(obj: Any) -> Any:
+    """Recursively sort dict keys for canonical msgpack encoding."""
+    if isinstance(obj, dict):
+        return {key: _sort_keys_deep(obj[key]) for key in sorted(obj)}
+    if isinstance(obj, (list, tuple)):
+        return [_sort_keys_deep(item) for item in obj]
+    return obj
+
+
 def compute_hash_dict(data: dict[str, Any], algorithm: str = "sha256") -> str:
     """Compute hash of a dictionary with deterministic serialization.
 
     The dictionary is serialized with sorted keys to ensure consistent
     hashing across different Python implementations and versions.
 
+    The default "sha256" algorithm canonicalizes via JSON and must stay
+    stable: existing ledgers were chained with it. "sha256-msgpack"
+    selects binary msgpack canonicalization (fewer bytes, C encoder)
+    and produces different digests, so it is opt-in for new ledgers.
+
     Args:
         data: Dictionary to hash.
-        algorithm: Hash algorithm to use.
+        algorithm: "sha256" (JSON canonical form) or "sha256-msgpack".
 
     Returns:
         Hexadecimal string representation of the hash.
+
+    Raises:
+        ValueError: If the algorithm is unsupported or msgpack is
+            requested but not installed.
     """
-    serialized = serialize_deterministic(data)
-    return compute_hash(serialized.encode("utf-8"), algorithm)
+    if algorithm == "sha256-msgpack":
+        if not HAS_MSGPACK:
+            raise ValueError(
+                "Algorithm 'sha256-msgpack' requires msgpack. "
+                "Run: pip install msgpack"
+            )
+        packed = msgpack.packb(_sort_keys_deep(data), use_bin_type=True)
+        return compute_hash(packed)
+    return compute_hash(serialize_deterministic_bytes(data), algorithm)
 
 
 def compute_chain_hash(
@@ -73,8 +110,15 @@ def compute_chain_hash(
     Returns:
         Hexadecimal string representation of the chained hash.
     """
-    combined = f"{prev_hash}:{entry_data}"
-    return compute_hash_str(combined, algorithm)
+    if algorithm != "sha256":
+        # Preserve the original delegation (and its algorithm checks)
+        # for anything other than the sha256 fast path
+        return compute_hash_str(f"{prev_hash}:{entry_data}", algorithm)
+    hasher = _SHA256_BASE.copy()
+    hasher.update(prev_hash.encode("utf-8"))
+    hasher.update(b":")
+    hasher.update(entry_data.encode("utf-8"))
+    return hasher.hexdigest()
 
 
 def genesis_hash() -> str:
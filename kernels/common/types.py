@@ -33,6 +33,17 @@ class ReceiptStatus(Enum):
     FAILED = "FAILED"
 
 
+class ReceiptError(Enum):
+    """Machine-readable denial categories for receipts.
+
+    Codes let callers route on the denial type with an identity compare
+    instead of scanning the human-readable error message.
+    """
+
+    MISSING_EVIDENCE = "MISSING_EVIDENCE"
+    MISSING_CONSTRAINTS = "MISSING_CONSTRAINTS"
+
+
 @dataclass(frozen=True)
 class ToolCall:
     """Specification of a tool invocation."""
@@ -67,6 +78,7 @@ class KernelReceipt:
     error: Optional[str] = None
     evidence_hash: Optional[str] = None
     tool_result: Optional[Any] = None
+    error_code: Optional[ReceiptError] = None
 
 
 @dataclass(frozen=True)
@@ -151,6 +163,8 @@ class DecisionEnvelope:
 class VirtualClock:
     """Deterministic clock for kernel operations."""
 
+    __slots__ = ("_current_ms",)
+
     def __init__(self, initial_ms: int = 0) -> None:
         """Initialize clock with starting time."""
         self._current_ms = initial_ms
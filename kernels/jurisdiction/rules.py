@@ -168,6 +168,59 @@ def check_tool_call_structure(request: KernelRequest) -> list[str]:
     return violations
 
 
+def evaluate_policy_batch(
+    requests: list[KernelRequest],
+    policy: JurisdictionPolicy,
+) -> list[PolicyResult]:
+    """Evaluate policy rules against a batch of requests.
+
+    Hoists policy attribute lookups and wildcard checks out of the
+    per-request loop, so batch callers (e.g. /submit_batch ingestion)
+    avoid re-deriving the same policy facts N times.
+
+    Args:
+        requests: The requests to evaluate.
+        policy: The policy to evaluate against.
+
+    Returns:
+        List of PolicyResult in the same order as requests.
+    """
+    # Policy-derived facts are loop-invariant; compute them once
+    actor_wildcard = "*" in policy.allowed_actors
+    tool_wildcard = "*" in policy.allowed_tools
+    allowed_actors = policy.allowed_actors
+    allowed_tools = policy.allowed_tools
+
+    results: list[PolicyResult] = []
+    for request in requests:
+        violations: list[str] = []
+
+        violations.extend(check_required_fields(request, policy))
+
+        # Inline actor/tool membership with precomputed wildcard flags
+        if not actor_wildcard and request.actor not in allowed_actors:
+            violations.append(f"Actor '{request.actor}' is not in allowed actors")
+
+        if request.tool_call is not None:
+            tool_name = (
+                request.tool_call.name
+                if isinstance(request.tool_call, ToolCall)
+                else request.tool_call.get("name", "")
+            )
+            if not tool_wildcard and tool_name not in allowed_tools:
+                violations.append(f"Tool '{tool_name}' is not in allowed tools")
+
+        violations.extend(check_param_size(request, policy))
+        violations.extend(check_intent_length(request, policy))
+        violations.extend(check_tool_call_structure(request))
+
+        results.append(
+            PolicyResult(allowed=len(violations) == 0, violations=violations)
+        )
+
+    return results
+
+
 def evaluate_policy(
     request: KernelRequest,
     policy: JurisdictionPolicy,
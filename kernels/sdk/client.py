@@ -10,9 +10,16 @@ import json
 import urllib.request
 import urllib.error
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 import asyncio
 
+try:
+    import msgpack
+
+    HAS_MSGPACK = True
+except ImportError:
+    HAS_MSGPACK = False
+
 from kernels.common.types import Request, Receipt, Decision
 from kernels.common.errors import KernelError
 
@@ -27,6 +34,7 @@ class ClientConfig:
     headers: Optional[Dict[str, str]] = None
     retry_count: int = 3
     retry_backoff: float = 1.0
+    wire_format: Literal["json", "msgpack"] = "json"
 
 
 class KernelClient:
@@ -46,11 +54,16 @@ class KernelClient:
         base_url: str = "http://localhost:8080",
         api_key: Optional[str] = None,
         timeout: float = 30.0,
+        wire_format: Literal["json", "msgpack"] = "json",
     ):
+        if wire_format == "msgpack" and not HAS_MSGPACK:
+            raise KernelError("msgpack not installed. Run: pip install msgpack")
+
         self.config = ClientConfig(
             base_url=base_url.rstrip("/"),
             api_key=api_key,
             timeout=timeout,
+            wire_format=wire_format,
         )
 
     def _make_request(
@@ -60,20 +73,30 @@ class KernelClient:
         data: Optional[Dict] = None,
     ) -> Dict[str, Any]:
         """Make HTTP request to kernel server."""
-        url = f"{self.config.base_url}{path}"
+        # Local-bind config once; avoids repeated attribute lookups per request
+        config = self.config
+        url = f"{config.base_url}{path}"
+
+        use_msgpack = config.wire_format == "msgpack"
+        content_type = "application/msgpack" if use_msgpack else "application/json"
 
         headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
+            "Content-Type": content_type,
+            "Accept": content_type,
         }
 
-        if self.config.api_key:
-            headers["Authorization"] = f"Bearer {self.config.api_key}"
+        if config.api_key:
+            headers["Authorization"] = f"Bearer {config.api_key}"
 
-        if self.config.headers:
-            headers.update(self.config.headers)
+        if config.headers:
+            headers.update(config.headers)
 
-        body = json.dumps(data).encode("utf-8") if data else None
+        if data is None:
+            body = None
+        elif use_msgpack:
+            body = msgpack.packb(data, use_bin_type=True)
+        else:
+            body = json.dumps(data).encode("utf-8")
 
         req = urllib.request.Request(
             url,
@@ -83,26 +106,41 @@ class KernelClient:
         )
 
         try:
-            with urllib.request.urlopen(req, timeout=self.config.timeout) as response:
-                return json.loads(response.read().decode("utf-8"))
+            with urllib.request.urlopen(req, timeout=config.timeout) as response:
+                raw = response.read()
+                # Decode based on the server's declared content type so JSON
+                # fallback still works against servers without msgpack
+                if "application/msgpack" in response.headers.get("Content-Type", ""):
+                    if not HAS_MSGPACK:
+                        raise KernelError(
+                            "Server sent a msgpack response but msgpack is "
+                            "not installed. Run: pip install msgpack"
+                        )
+                    return msgpack.unpackb(raw, raw=False)
+                return json.loads(raw.decode("utf-8"))
         except urllib.error.HTTPError as e:
-            error_body = e.read().decode("utf-8")
+            raw = e.read()
+            # Error bodies are encoded like success bodies, so decode them
+            # the same way or msgpack errors come through as garbage bytes
+            if "application/msgpack" in e.headers.get("Content-Type", ""):
+                if not HAS_MSGPACK:
+                    raise KernelError(
+                        f"HTTP {e.code}: server sent a msgpack error body "
+                        "but msgpack is not installed. Run: pip install msgpack"
+                    )
+                error_body = msgpack.unpackb(raw, raw=False)
+            else:
+                error_body = raw.decode("utf-8", errors="replace")
             raise KernelError(f"HTTP {e.code}: {error_body}")
         except urllib.error.URLError as e:
             raise KernelError(f"Connection error: {e.reason}")
 
-    def submit(self, request: Request) -> Receipt:
-        """
-        Submit a request to the kernel.
-
-        Args:
-            request: The request to submit
-
-        Returns:
-            Receipt with decision and result
-        """
+    @staticmethod
+    def _request_to_dict(request: Request) -> Dict[str, Any]:
+        """Convert a Request to a wire payload dict."""
         data = {
             "request_id": request.request_id,
+            "ts_ms": request.ts_ms,
             "actor": request.actor,
             "intent": request.intent,
         }
@@ -113,14 +151,17 @@ class KernelClient:
                 "params": request.tool_call.params,
             }
 
+        if request.params:
+            data["params"] = request.params
+
         if request.evidence:
             data["evidence"] = request.evidence
 
-        if request.constraints:
-            data["constraints"] = request.constraints
-
-        response = self._make_request("POST", "/submit", data)
+        return data
 
+    @staticmethod
+    def _receipt_from_dict(response: Dict[str, Any]) -> Receipt:
+        """Convert a wire response dict back to a Receipt."""
         return Receipt(
             request_id=response["request_id"],
             status=response["status"],
@@ -129,9 +170,26 @@ class KernelClient:
             error=response.get("error"),
         )
 
+    def submit(self, request: Request) -> Receipt:
+        """
+        Submit a request to the kernel.
+
+        Args:
+            request: The request to submit
+
+        Returns:
+            Receipt with decision and result
+        """
+        data = self._request_to_dict(request)
+        response = self._make_request("POST", "/submit", data)
+        return self._receipt_from_dict(response)
+
     def submit_batch(self, requests: List[Request]) -> List[Receipt]:
         """
-        Submit multiple requests.
+        Submit multiple requests in a single HTTP call.
+
+        Uses the /submit_batch endpoint so the whole batch costs one
+        roundtrip instead of one per request.
 
         Args:
             requests: List of requests to submit
@@ -139,7 +197,9 @@ class KernelClient:
         Returns:
             List of receipts in same order
         """
-        return [self.submit(req) for req in requests]
+        data = {"requests": [self._request_to_dict(req) for req in requests]}
+        response = self._make_request("POST", "/submit_batch", data)
+        return [self._receipt_from_dict(item) for item in response["receipts"]]
 
     def health(self) -> Dict[str, Any]:
         """
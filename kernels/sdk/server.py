@@ -11,12 +11,80 @@ from http.server import HTTPServer, BaseHTTPRequestHandler
 from typing import Any, Dict, Optional, Type
 import threading
 
+try:
+    import msgpack
+
+    HAS_MSGPACK = True
+except ImportError:
+    HAS_MSGPACK = False
+
+try:
+    import msgspec
+
+    HAS_MSGSPEC = True
+except ImportError:
+    HAS_MSGSPEC = False
+
 from kernels.common.types import Request, ToolCall
 from kernels.variants.base import BaseKernel
 from kernels.variants.strict_kernel import StrictKernel
 from kernels.jurisdiction.policy import JurisdictionPolicy
 
 
+if HAS_MSGSPEC:
+
+    class ToolCallMsg(msgspec.Struct):
+        """Schema for tool_call payloads."""
+
+        name: str
+        params: Dict[str, Any] = {}
+
+    class RequestMsg(msgspec.Struct):
+        """Schema for /submit payloads, decoded directly from JSON bytes.
+
+        Mirrors the KernelRequest fields; a top-level "constraints" dict
+        is still accepted and folded into params for kernels that read
+        params["constraints"].
+        """
+
+        request_id: str
+        ts_ms: int
+        actor: str
+        intent: str
+        tool_call: Optional[ToolCallMsg] = None
+        params: Dict[str, Any] = {}
+        evidence: Optional[str] = None
+        constraints: Optional[Dict[str, Any]] = None
+
+    # Reusable decoder; decoding into a fixed struct skips the
+    # dict-then-lookup dance of json.loads + data["x"]
+    _REQUEST_DECODER = msgspec.json.Decoder(RequestMsg)
+    _SCHEMA_ERRORS: tuple = (msgspec.ValidationError, msgspec.DecodeError)
+
+    def _request_from_msg(msg: RequestMsg) -> Request:
+        """Build a Request from a decoded RequestMsg."""
+        tool_call = None
+        if msg.tool_call is not None:
+            tool_call = ToolCall(name=msg.tool_call.name, params=msg.tool_call.params)
+
+        params = msg.params
+        if msg.constraints is not None:
+            params = dict(params, constraints=msg.constraints)
+
+        return Request(
+            request_id=msg.request_id,
+            ts_ms=msg.ts_ms,
+            actor=msg.actor,
+            intent=msg.intent,
+            tool_call=tool_call,
+            params=params,
+            evidence=msg.evidence,
+        )
+
+else:
+    _SCHEMA_ERRORS = ()
+
+
 class KernelRequestHandler(BaseHTTPRequestHandler):
     """HTTP request handler for kernel server."""
 
@@ -24,18 +92,31 @@ class KernelRequestHandler(BaseHTTPRequestHandler):
     kernel: Optional[BaseKernel] = None
 
     def _send_json(self, status: int, data: Dict[str, Any]) -> None:
-        """Send JSON response."""
+        """Send response body, honoring msgpack content negotiation."""
+        if HAS_MSGPACK and "application/msgpack" in self.headers.get("Accept", ""):
+            content_type = "application/msgpack"
+            body = msgpack.packb(data, use_bin_type=True)
+        else:
+            content_type = "application/json"
+            body = json.dumps(data).encode("utf-8")
+
         self.send_response(status)
-        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Type", content_type)
         self.send_header("Access-Control-Allow-Origin", "*")
         self.end_headers()
-        self.wfile.write(json.dumps(data).encode("utf-8"))
+        self.wfile.write(body)
 
     def _read_json(self) -> Dict[str, Any]:
-        """Read JSON from request body."""
+        """Read request body, decoding JSON or msgpack per Content-Type."""
         content_length = int(self.headers.get("Content-Length", 0))
         body = self.rfile.read(content_length)
-        return json.loads(body.decode("utf-8")) if body else {}
+        if not body:
+            return {}
+        if HAS_MSGPACK and "application/msgpack" in self.headers.get(
+            "Content-Type", ""
+        ):
+            return msgpack.unpackb(body, raw=False)
+        return json.loads(body.decode("utf-8"))
 
     def do_OPTIONS(self) -> None:
         """Handle CORS preflight."""
@@ -64,6 +145,8 @@ class KernelRequestHandler(BaseHTTPRequestHandler):
         """Handle POST requests."""
         if self.path == "/submit":
             self._handle_submit()
+        elif self.path == "/submit_batch":
+            self._handle_submit_batch()
         elif self.path == "/halt":
             self._handle_halt()
         else:
@@ -82,7 +165,9 @@ class KernelRequestHandler(BaseHTTPRequestHandler):
 
     def _handle_health(self) -> None:
         """Handle health check."""
-        if not self.kernel:
+        # Local-bind the kernel once; avoids repeated class-attr lookups
+        kernel = self.kernel
+        if not kernel:
             self._send_json(503, {"status": "unhealthy", "error": "No kernel"})
             return
 
@@ -90,40 +175,43 @@ class KernelRequestHandler(BaseHTTPRequestHandler):
             200,
             {
                 "status": "healthy",
-                "kernel_state": self.kernel.state.value,
+                "kernel_state": kernel.state.value,
             },
         )
 
     def _handle_status(self) -> None:
         """Handle status request."""
-        if not self.kernel:
+        kernel = self.kernel
+        if not kernel:
             self._send_json(503, {"error": "No kernel"})
             return
 
         self._send_json(
             200,
             {
-                "kernel_id": self.kernel.kernel_id,
-                "state": self.kernel.state.value,
+                "kernel_id": kernel.kernel_id,
+                "state": kernel.state.value,
             },
         )
 
     def _handle_evidence(self) -> None:
         """Handle evidence export."""
-        if not self.kernel:
+        kernel = self.kernel
+        if not kernel:
             self._send_json(503, {"error": "No kernel"})
             return
 
-        evidence = self.kernel.export_evidence()
+        evidence = kernel.export_evidence()
         self._send_json(200, evidence)
 
     def _handle_policy(self) -> None:
         """Handle policy request."""
-        if not self.kernel:
+        kernel = self.kernel
+        if not kernel:
             self._send_json(503, {"error": "No kernel"})
             return
 
-        policy = self.kernel.policy
+        policy = kernel.policy
         self._send_json(
             200,
             {
@@ -134,45 +222,97 @@ class KernelRequestHandler(BaseHTTPRequestHandler):
             },
         )
 
+    def _build_request(self, data: Dict[str, Any]) -> Request:
+        """Build a Request from a decoded payload dict."""
+        tool_call = None
+        if "tool_call" in data:
+            tool_call = ToolCall(
+                name=data["tool_call"]["name"],
+                params=data["tool_call"].get("params", {}),
+            )
+
+        params = data.get("params", {})
+        if data.get("constraints") is not None:
+            params = dict(params, constraints=data["constraints"])
+
+        return Request(
+            request_id=data["request_id"],
+            ts_ms=data["ts_ms"],
+            actor=data["actor"],
+            intent=data["intent"],
+            tool_call=tool_call,
+            params=params,
+            evidence=data.get("evidence"),
+        )
+
+    def _receipt_to_dict(self, receipt: Any) -> Dict[str, Any]:
+        """Convert a receipt to a response payload dict."""
+        return {
+            "request_id": receipt.request_id,
+            "status": receipt.status,
+            "decision": receipt.decision.value,
+            "result": receipt.result,
+            "error": receipt.error,
+        }
+
+    def _read_request(self) -> Request:
+        """Read and decode the request body into a Request.
+
+        Uses the msgspec schema decoder for JSON bodies when available;
+        falls back to the generic dict-based path otherwise.
+        """
+        if HAS_MSGSPEC and "application/msgpack" not in self.headers.get(
+            "Content-Type", ""
+        ):
+            content_length = int(self.headers.get("Content-Length", 0))
+            body = self.rfile.read(content_length)
+            return _request_from_msg(_REQUEST_DECODER.decode(body))
+
+        return self._build_request(self._read_json())
+
     def _handle_submit(self) -> None:
         """Handle request submission."""
-        if not self.kernel:
+        kernel = self.kernel
+        if not kernel:
+            self._send_json(503, {"error": "No kernel"})
+            return
+
+        try:
+            request = self._read_request()
+
+            # Submit to kernel
+            receipt = kernel.submit(request)
+
+            self._send_json(200, self._receipt_to_dict(receipt))
+
+        except _SCHEMA_ERRORS as e:
+            self._send_json(400, {"error": f"Invalid request: {e}"})
+        except KeyError as e:
+            self._send_json(400, {"error": f"Missing field: {e}"})
+        except Exception as e:
+            self._send_json(500, {"error": str(e)})
+
+    def _handle_submit_batch(self) -> None:
+        """Handle batch request submission.
+
+        Accepts {"requests": [...]} and returns {"receipts": [...]} in the
+        same order, amortizing HTTP roundtrip overhead over the batch.
+        """
+        kernel = self.kernel
+        if not kernel:
             self._send_json(503, {"error": "No kernel"})
             return
 
         try:
             data = self._read_json()
+            requests = data["requests"]
 
-            # Build request
-            tool_call = None
-            if "tool_call" in data:
-                tool_call = ToolCall(
-                    name=data["tool_call"]["name"],
-                    params=data["tool_call"].get("params", {}),
-                )
-
-            request = Request(
-                request_id=data["request_id"],
-                actor=data["actor"],
-                intent=data["intent"],
-                tool_call=tool_call,
-                evidence=data.get("evidence"),
-                constraints=data.get("constraints"),
-            )
+            receipts = [
+                self._receipt_to_dict(kernel.submit(self._build_request(item)))
+                for item in requests
+            ]
 
-            # Submit to kernel
-            receipt = self.kernel.submit(request)
-
-            self._send_json(
-                200,
-                {
-                    "request_id": receipt.request_id,
-                    "status": receipt.status,
-                    "decision": receipt.decision.value,
-                    "result": receipt.result,
-                    "error": receipt.error,
-                },
-            )
+            self._send_json(200, {"receipts": receipts})
 
         except KeyError as e:
             self._send_json(400, {"error": f"Missing field: {e}"})
@@ -181,16 +321,17 @@ class KernelRequestHandler(BaseHTTPRequestHandler):
 
     def _handle_halt(self) -> None:
         """Handle halt request."""
-        if not self.kernel:
+        kernel = self.kernel
+        if not kernel:
             self._send_json(503, {"error": "No kernel"})
             return
 
-        self.kernel.halt()
+        kernel.halt()
         self._send_json(
             200,
             {
                 "status": "halted",
-                "kernel_state": self.kernel.state.value,
+                "kernel_state": kernel.state.value,
             },
         )
 
@@ -228,9 +369,13 @@ class KernelServer:
         kernel = self.kernel
 
         class Handler(KernelRequestHandler):
-            pass
+            def __init__(self, *args, **kwargs) -> None:
+                # Bind the kernel to the instance before super().__init__,
+                # which services the request. Instance attributes skip the
+                # class-attr MRO walk on every self.kernel access.
+                self.kernel = kernel
+                super().__init__(*args, **kwargs)
 
-        Handler.kernel = kernel
         return Handler
 
     def start(self, blocking: bool = True) -> None:
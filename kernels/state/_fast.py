@@ -0,0 +1,63 @@
+"""Optional Numba-accelerated helpers for FSM hot functions.
+
+When numba (and numpy) are installed, long transition paths can be
+validated by a JIT-compiled scan over the integer mask table instead of
+the interpreted loop. Everything here is optional: without numba the
+factory returns None and callers keep the pure-Python path.
+"""
+
+from typing import Callable, Optional
+
+from kernels.common.types import KernelState
+
+try:
+    import numpy as np
+    from numba import njit
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+if HAS_NUMBA:
+
+    @njit(cache=True)
+    def _first_invalid_edge(path_indices, mask_table):  # pragma: no cover
+        """Return the index of the first invalid edge, or -1 if valid."""
+        for i in range(path_indices.shape[0] - 1):
+            if not (mask_table[path_indices[i]] >> path_indices[i + 1]) & 1:
+                return i
+        return -1
+
+    def make_path_scanner(
+        mask: tuple[int, ...],
+        state_index: dict[KernelState, int],
+    ) -> Optional[Callable[[list[KernelState]], int]]:
+        """Build a compiled path scanner over the given mask table.
+
+        Args:
+            mask: Per-state transition bitmasks.
+            state_index: State -> integer index mapping.
+
+        Returns:
+            Callable mapping a path to the first invalid edge index
+            (-1 if the whole path is valid).
+        """
+        mask_array = np.array(mask, dtype=np.int64)
+
+        def scan(path: list[KernelState]) -> int:
+            indices = np.fromiter(
+                (state_index[s] for s in path), dtype=np.int64, count=len(path)
+            )
+            return int(_first_invalid_edge(indices, mask_array))
+
+        return scan
+
+else:
+
+    def make_path_scanner(
+        mask: tuple[int, ...],
+        state_index: dict[KernelState, int],
+    ) -> Optional[Callable[[list[KernelState]], int]]:
+        """Numba is not installed; callers fall back to pure Python."""
+        return None
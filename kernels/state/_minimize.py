@@ -0,0 +1,101 @@
+"""FSM minimization analysis for the kernel state machine.
+
+Offline partition-refinement pass over ALLOWED_TRANSITIONS that reports
+behaviorally equivalent states. The public KernelState enum is never
+modified; this module exists so maintainers can verify that no states
+are redundant before extending the FSM.
+
+Note: under pure transition equivalence (no state labels), every
+non-terminal kernel state collapses into one class because the FSM has
+no accepting/output distinction. Kernel states are distinguished by
+their role (validation vs execution vs audit), so the default analysis
+labels each state with itself, which keeps roles distinct and only
+flags states that are truly interchangeable.
+"""
+
+import warnings
+from typing import Hashable, Optional
+
+from kernels.common.types import KernelState
+
+
+def compute_equivalence_classes(
+    transitions: dict[KernelState, frozenset[KernelState]],
+    labels: Optional[dict[KernelState, Hashable]] = None,
+) -> list[frozenset[KernelState]]:
+    """Partition states into behavioral equivalence classes.
+
+    Uses Moore-style partition refinement: start from the label
+    partition (terminal vs non-terminal when labels are omitted), then
+    split classes whose members reach different classes, until stable.
+
+    Args:
+        transitions: Mapping of state -> allowed target states.
+        labels: Optional per-state labels treated as observable output.
+            States with different labels are never merged. Defaults to
+            distinguishing terminal from non-terminal states only.
+
+    Returns:
+        List of frozensets, each one equivalence class of states.
+    """
+    states = list(transitions)
+
+    if labels is None:
+        labels = {s: len(transitions[s]) == 0 for s in states}
+
+    # Initial partition by label
+    by_label: dict[Hashable, set[KernelState]] = {}
+    for state in states:
+        by_label.setdefault(labels[state], set()).add(state)
+    partition = list(by_label.values())
+
+    def class_of(state: KernelState) -> int:
+        for idx, cls in enumerate(partition):
+            if state in cls:
+                return idx
+        raise KeyError(state)
+
+    changed = True
+    while changed:
+        changed = False
+        refined: list[set[KernelState]] = []
+        for cls in partition:
+            # Split by transition signature: the set of classes reached
+            by_signature: dict[frozenset[int], set[KernelState]] = {}
+            for state in cls:
+                signature = frozenset(class_of(t) for t in transitions[state])
+                by_signature.setdefault(signature, set()).add(state)
+            if len(by_signature) > 1:
+                changed = True
+            refined.extend(by_signature.values())
+        partition = refined
+
+    return [frozenset(cls) for cls in partition]
+
+
+def report_equivalent_states(
+    transitions: dict[KernelState, frozenset[KernelState]],
+) -> list[frozenset[KernelState]]:
+    """Report any behaviorally equivalent states with a warning.
+
+    Each state is labeled with itself, so only states that are
+    interchangeable in every observable respect are merged. Any merge
+    indicates a redundant state that maintainers should review.
+
+    Args:
+        transitions: Mapping of state -> allowed target states.
+
+    Returns:
+        Equivalence classes containing more than one state.
+    """
+    classes = compute_equivalence_classes(
+        transitions, labels={s: s for s in transitions}
+    )
+    merged = [cls for cls in classes if len(cls) > 1]
+    for cls in merged:
+        warnings.warn(
+            "Behaviorally equivalent kernel states: "
+            + ", ".join(sorted(s.value for s in cls)),
+            stacklevel=2,
+        )
+    return merged
@@ -4,11 +4,21 @@ The state machine enforces deterministic state transitions and fail-closed
 behavior. Invalid transitions raise StateError.
 """
 
+import struct
 from typing import Callable, Optional
 
 from kernels.common.types import KernelState
 from kernels.common.errors import StateError
-from kernels.state.transitions import can_transition, is_terminal
+from kernels.state.transitions import _TRANSITION_MASK, is_terminal
+
+
+# Stable state <-> index mapping for binary snapshots (enum definition order)
+_STATE_ORDER: tuple[KernelState, ...] = tuple(KernelState)
+_STATE_INDEX: dict[KernelState, int] = {s: i for i, s in enumerate(_STATE_ORDER)}
+
+# Packed snapshot layout: 1-byte state index + 4-byte transition count,
+# little-endian so snapshots are portable across host byte orders
+_SNAPSHOT_STRUCT = struct.Struct("<BI")
 
 
 class StateMachine:
@@ -18,6 +28,8 @@ class StateMachine:
     transitioned to IDLE before accepting requests.
     """
 
+    __slots__ = ("_state", "_on_transition", "_transition_count")
+
     def __init__(
         self,
         initial_state: KernelState = KernelState.BOOTING,
@@ -46,7 +58,9 @@ class StateMachine:
     @property
     def is_halted(self) -> bool:
         """Check if the machine is in HALTED state."""
-        return self._state == KernelState.HALTED
+        # Enum members are interned singletons; identity check skips
+        # the rich-comparison dispatch
+        return self._state is KernelState.HALTED
 
     @property
     def is_terminal(self) -> bool:
@@ -65,17 +79,20 @@ class StateMachine:
         Raises:
             StateError: If transition is not allowed.
         """
-        if self.is_terminal:
-            raise StateError(
-                f"Cannot transition from terminal state {self._state.value}"
-            )
-
-        if not can_transition(self._state, to_state):
+        # Hot path: one mask fetch covers both the terminal check (a
+        # terminal state has an all-zero mask) and the edge check,
+        # without a can_transition call per transition
+        from_state = self._state
+        mask = _TRANSITION_MASK[_STATE_INDEX[from_state]]
+        if not (mask >> _STATE_INDEX[to_state]) & 1:
+            if mask == 0:
+                raise StateError(
+                    f"Cannot transition from terminal state {from_state.value}"
+                )
             raise StateError(
-                f"Invalid transition: {self._state.value} -> {to_state.value}"
+                f"Invalid transition: {from_state.value} -> {to_state.value}"
             )
 
-        from_state = self._state
         self._state = to_state
         self._transition_count += 1
 
@@ -119,11 +136,55 @@ class StateMachine:
         Raises:
             StateError: If not in expected state.
         """
-        if self._state != expected:
+        if self._state is not expected:
             raise StateError(
                 f"Expected state {expected.value}, but in {self._state.value}"
             )
 
+    def pack(self) -> bytes:
+        """Pack the machine state into a compact binary snapshot.
+
+        The snapshot is 5 bytes: a 1-byte state index and a 4-byte
+        transition count. Useful for checkpointing large fleets of
+        machines without per-field Python object overhead.
+
+        Returns:
+            Packed snapshot bytes.
+
+        Raises:
+            StateError: If the machine state does not fit the snapshot
+                layout (transition count beyond the 32-bit counter).
+        """
+        try:
+            return _SNAPSHOT_STRUCT.pack(
+                _STATE_INDEX[self._state], self._transition_count
+            )
+        except struct.error as e:
+            raise StateError(f"Cannot pack state machine snapshot: {e}")
+
+    @classmethod
+    def unpack(cls, snapshot: bytes) -> "StateMachine":
+        """Restore a machine from a packed binary snapshot.
+
+        Args:
+            snapshot: Bytes produced by pack().
+
+        Returns:
+            StateMachine with the snapshot's state and transition count.
+
+        Raises:
+            StateError: If the snapshot is malformed.
+        """
+        try:
+            state_index, transition_count = _SNAPSHOT_STRUCT.unpack(snapshot)
+            state = _STATE_ORDER[state_index]
+        except (struct.error, IndexError) as e:
+            raise StateError(f"Invalid state machine snapshot: {e}")
+
+        machine = cls(initial_state=state)
+        machine._transition_count = transition_count
+        return machine
+
     def assert_not_halted(self) -> None:
         """Assert that the machine is not halted.
 
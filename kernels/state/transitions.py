@@ -7,42 +7,134 @@ transition validity.
 from typing import Optional
 
 from kernels.common.types import KernelState
-
+from kernels.state._fast import make_path_scanner
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+# The FSM as data: every allowed edge, declared once. All other
+# structures in this module (the per-state sets, the bitmask tables, the
+# reachability closure, the adjacency matrix) are derived from this
+# tuple at import, so the fast-path representations cannot drift from
+# the declared rules.
+TRANSITIONS: tuple[tuple[KernelState, KernelState], ...] = (
+    (KernelState.BOOTING, KernelState.IDLE),
+    (KernelState.BOOTING, KernelState.HALTED),
+    (KernelState.IDLE, KernelState.VALIDATING),
+    (KernelState.IDLE, KernelState.HALTED),
+    (KernelState.VALIDATING, KernelState.ARBITRATING),
+    (KernelState.VALIDATING, KernelState.AUDITING),  # For validation failures
+    (KernelState.VALIDATING, KernelState.HALTED),
+    (KernelState.ARBITRATING, KernelState.EXECUTING),
+    (KernelState.ARBITRATING, KernelState.AUDITING),  # For denied requests
+    (KernelState.ARBITRATING, KernelState.HALTED),
+    (KernelState.EXECUTING, KernelState.AUDITING),
+    (KernelState.EXECUTING, KernelState.HALTED),
+    (KernelState.AUDITING, KernelState.IDLE),
+    (KernelState.AUDITING, KernelState.HALTED),
+    # HALTED is terminal: no outgoing edges
+)
 
 # Allowed transitions: from_state -> set of allowed to_states
 ALLOWED_TRANSITIONS: dict[KernelState, frozenset[KernelState]] = {
-    KernelState.BOOTING: frozenset({KernelState.IDLE, KernelState.HALTED}),
-    KernelState.IDLE: frozenset({KernelState.VALIDATING, KernelState.HALTED}),
-    KernelState.VALIDATING: frozenset(
-        {
-            KernelState.ARBITRATING,
-            KernelState.AUDITING,  # For validation failures
-            KernelState.HALTED,
-        }
-    ),
-    KernelState.ARBITRATING: frozenset(
-        {
-            KernelState.EXECUTING,
-            KernelState.AUDITING,  # For denied requests
-            KernelState.HALTED,
-        }
-    ),
-    KernelState.EXECUTING: frozenset(
-        {
-            KernelState.AUDITING,
-            KernelState.HALTED,
-        }
-    ),
-    KernelState.AUDITING: frozenset(
-        {
-            KernelState.IDLE,
-            KernelState.HALTED,
-        }
-    ),
-    KernelState.HALTED: frozenset(),  # Terminal state, no transitions allowed
+    state: frozenset(
+        to_state for from_state, to_state in TRANSITIONS if from_state is state
+    )
+    for state in KernelState
 }
 
 
+# Integer index per state (enum definition order) for bitmask tables
+_STATE_INDEX: dict[KernelState, int] = {s: i for i, s in enumerate(KernelState)}
+
+# Flat bitmask table: _TRANSITION_MASK[i] has bit j set iff state i may
+# transition to state j. Turns the dict-plus-frozenset lookup in the hot
+# path into two index operations and a bit test.
+_TRANSITION_MASK: tuple[int, ...] = tuple(
+    sum(1 << _STATE_INDEX[to_state] for to_state in ALLOWED_TRANSITIONS[state])
+    for state in KernelState
+)
+
+# Derived lookups, computed once from the table
+_EMPTY: frozenset[KernelState] = frozenset()  # Shared fallback
+
+# The whole adjacency matrix packed into one int: 8 bits per from-state
+# row, bit (i*8 + j) set iff state i may transition to state j. With at
+# most 8 states the matrix fits a single machine word.
+_BITS_PER_ROW = 8
+assert len(KernelState) <= _BITS_PER_ROW, "FSM matrix rows overflow 8 bits"
+_FSM_MATRIX: int = 0
+for _from_state, _targets in ALLOWED_TRANSITIONS.items():
+    for _to_state in _targets:
+        _FSM_MATRIX |= 1 << (
+            _STATE_INDEX[_from_state] * _BITS_PER_ROW + _STATE_INDEX[_to_state]
+        )
+del _from_state, _targets, _to_state
+
+
+# Optional compiled scanner for long-path validation (None without numba)
+_FAST_PATH_SCAN = make_path_scanner(_TRANSITION_MASK, _STATE_INDEX)
+_FAST_PATH_MIN_LEN = 32
+
+if HAS_NUMPY:
+    # Adjacency matrix form of the transition table for bulk validation:
+    # _ADJACENCY[i, j] is 1 iff state i may transition to state j, with
+    # indices in KernelState definition order
+    _ADJACENCY = np.zeros((len(KernelState), len(KernelState)), dtype=np.uint8)
+    for _row, _mask in enumerate(_TRANSITION_MASK):
+        for _col in range(len(KernelState)):
+            if (_mask >> _col) & 1:
+                _ADJACENCY[_row, _col] = 1
+    del _row, _mask, _col
+
+
+def _compute_reachable_masks(masks: tuple[int, ...]) -> tuple[int, ...]:
+    """Compute the transitive closure of the transition masks.
+
+    Warshall-style pass on bitmasks: each state's mask absorbs the masks
+    of every state it can reach, until a fixed point.
+    """
+    closure = list(masks)
+    changed = True
+    while changed:
+        changed = False
+        for i in range(len(closure)):
+            mask = closure[i]
+            while mask:
+                j = (mask & -mask).bit_length() - 1
+                merged = closure[i] | closure[j]
+                if merged != closure[i]:
+                    closure[i] = merged
+                    changed = True
+                mask &= mask - 1
+    return tuple(closure)
+
+
+# Transitive reachability: bit j of _REACHABLE_MASK[i] is set iff state j
+# is reachable from state i through one or more transitions
+_REACHABLE_MASK: tuple[int, ...] = _compute_reachable_masks(_TRANSITION_MASK)
+
+
+def is_reachable(from_state: KernelState, to_state: KernelState) -> bool:
+    """Check if a state is reachable through one or more transitions.
+
+    Args:
+        from_state: Starting state.
+        to_state: Target state.
+
+    Returns:
+        True if to_state is reachable from from_state, False otherwise.
+    """
+    return bool(
+        (_REACHABLE_MASK[_STATE_INDEX[from_state]] >> _STATE_INDEX[to_state]) & 1
+    )
+
+
 def can_transition(from_state: KernelState, to_state: KernelState) -> bool:
     """Check if a transition is allowed.
 
@@ -53,8 +145,13 @@ def can_transition(from_state: KernelState, to_state: KernelState) -> bool:
     Returns:
         True if transition is allowed, False otherwise.
     """
-    allowed = ALLOWED_TRANSITIONS.get(from_state, frozenset())
-    return to_state in allowed
+    return bool(
+        (
+            _FSM_MATRIX
+            >> (_STATE_INDEX[from_state] * _BITS_PER_ROW + _STATE_INDEX[to_state])
+        )
+        & 1
+    )
 
 
 def get_next_states(state: KernelState) -> frozenset[KernelState]:
@@ -66,7 +163,7 @@ def get_next_states(state: KernelState) -> frozenset[KernelState]:
     Returns:
         Frozenset of reachable states.
     """
-    return ALLOWED_TRANSITIONS.get(state, frozenset())
+    return ALLOWED_TRANSITIONS.get(state, _EMPTY)
 
 
 def is_terminal(state: KernelState) -> bool:
@@ -78,7 +175,8 @@ def is_terminal(state: KernelState) -> bool:
     Returns:
         True if terminal, False otherwise.
     """
-    return len(ALLOWED_TRANSITIONS.get(state, frozenset())) == 0
+    # Terminal means an all-zero row in the transition mask table
+    return _TRANSITION_MASK[_STATE_INDEX[state]] == 0
 
 
 def validate_transition_path(path: list[KernelState]) -> tuple[bool, Optional[str]]:
@@ -93,10 +191,51 @@ def validate_transition_path(path: list[KernelState]) -> tuple[bool, Optional[st
     if len(path) < 2:
         return True, None
 
-    for i in range(len(path) - 1):
-        from_state = path[i]
-        to_state = path[i + 1]
-        if not can_transition(from_state, to_state):
+    # Long paths (ledger replays) go through the compiled scanner when
+    # numba is available; the array conversion only pays off past the
+    # threshold
+    if _FAST_PATH_SCAN is not None and len(path) >= _FAST_PATH_MIN_LEN:
+        bad = _FAST_PATH_SCAN(path)
+        if bad < 0:
+            return True, None
+        return (
+            False,
+            f"Invalid transition: {path[bad].value} -> {path[bad + 1].value}",
+        )
+
+    # Inline the bitmask test per edge; avoids a can_transition call
+    # (frame setup plus lookups) for every step of long replay paths.
+    # zip pairs adjacent states in C, dropping the index arithmetic a
+    # range loop would run per hop.
+    mask_tab = _TRANSITION_MASK
+    state_index = _STATE_INDEX
+    for from_state, to_state in zip(path, path[1:]):
+        if not (mask_tab[state_index[from_state]] >> state_index[to_state]) & 1:
             return False, f"Invalid transition: {from_state.value} -> {to_state.value}"
 
     return True, None
+
+
+def validate_transition_paths_bulk(paths: "np.ndarray") -> "np.ndarray":
+    """Validate many equal-length transition paths in one array operation.
+
+    Intended for batch callers (replay fuzzing, ledger audits) that hold
+    paths as integer arrays: every edge of every path is checked by one
+    fancy-indexed lookup into the adjacency matrix instead of a Python
+    loop per hop.
+
+    Args:
+        paths: 2-D integer array, one path per row, each element a state
+            index in KernelState definition order.
+
+    Returns:
+        1-D boolean array with True for each row whose every adjacent
+        pair is an allowed transition.
+
+    Raises:
+        RuntimeError: If numpy is not installed.
+    """
+    if not HAS_NUMPY:
+        raise RuntimeError("numpy not installed. Run: pip install numpy")
+    paths = np.asarray(paths)
+    return _ADJACENCY[paths[:, :-1], paths[:, 1:]].all(axis=1)
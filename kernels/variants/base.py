@@ -5,7 +5,8 @@ provides common functionality that variants can extend.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Optional
+from dataclasses import replace
+from typing import Any, Callable, Optional, Sequence
 
 from kernels.common.types import (
     Decision,
@@ -15,6 +16,7 @@ from kernels.common.types import (
     KernelReceipt,
     KernelRequest,
     KernelState,
+    ReceiptError,
     ReceiptStatus,
     ToolCall,
 )
@@ -42,12 +44,20 @@ from kernels.permits import (
 )
 
 
+# Shared sentinel for the no-violations fast path: callers only
+# truth-test and join the result, so one immutable empty tuple avoids a
+# fresh list allocation per allow-path request
+_NO_ERRORS: Sequence[str] = ()
+
+
 class Kernel(ABC):
     """Protocol defining the kernel API surface.
 
     All kernel variants must implement these methods.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def boot(self, config: KernelConfig) -> None:
         """Boot the kernel with configuration.
@@ -122,6 +132,26 @@ class BaseKernel(Kernel):
     Variants extend this class and override specific behaviors.
     """
 
+    # Fixed attribute layout: kernels are long-lived but the slot layout
+    # drops the per-instance __dict__ and speeds up every attribute load
+    # in the submit/step hot path
+    __slots__ = (
+        "_config",
+        "_state_machine",
+        "_ledger",
+        "_policy",
+        "_dispatcher",
+        "_runtime",
+        "_pending_request",
+        "_pending_decision",
+        "_pending_result",
+        "_nonce_registry",
+        "_keyring",
+    )
+
+    # Config fields forced by the variant; subclasses declare their own
+    _OVERLAY: dict[str, Any] = {}
+
     def __init__(self) -> None:
         """Initialize base kernel state."""
         self._config: Optional[KernelConfig] = None
@@ -186,15 +216,8 @@ class BaseKernel(Kernel):
         # This ensures tie-breaking when timestamps are identical
         sorted_entries = sorted(evidence.ledger_entries, key=lambda e: e.ledger_seq)
 
-        # Rebuild ledger
-        for entry in sorted_entries:
-            # Re-add entry to ledger (this updates hash chain)
-            self._ledger._entries.append(entry)
-            self._ledger._last_hash = entry.entry_hash
-
-        # Restore sequence counter from last entry
-        if sorted_entries:
-            self._ledger._next_seq = sorted_entries[-1].ledger_seq + 1
+        # Rebuild ledger (restores the hash chain and sequence counter)
+        self._ledger.restore(sorted_entries)
 
         # Rebuild nonce registry from entries with permit verification
         # Must process in ledger_seq order to correctly reconstruct use_count
@@ -218,11 +241,24 @@ class BaseKernel(Kernel):
                     current_time_ms=entry.ts_ms,
                 )
 
+    def _apply_variant_overrides(self, config: KernelConfig) -> KernelConfig:
+        """Apply this variant's class-level config overlay.
+
+        Args:
+            config: Caller-supplied configuration.
+
+        Returns:
+            Config with the variant's forced fields applied.
+        """
+        overlay = self._OVERLAY
+        return replace(config, **overlay) if overlay else config
+
     def boot(self, config: KernelConfig) -> None:
         """Boot the kernel with configuration."""
         if self._state_machine is not None and not self._state_machine.is_halted:
             raise BootError("Kernel already booted")
 
+        config = self._apply_variant_overrides(config)
         self._config = config
         self._state_machine = StateMachine(KernelState.BOOTING)
         self._ledger = AuditLedger(config.kernel_id, config.variant)
@@ -236,6 +272,34 @@ class BaseKernel(Kernel):
         # Transition to IDLE
         self._state_machine.transition(KernelState.IDLE)
 
+    def reset(self) -> None:
+        """Reset the kernel to a freshly booted state.
+
+        Re-initializes the state machine, ledger, runtime, nonce registry,
+        and any pending request state from the existing configuration,
+        skipping the boot-time wiring (policy, dispatcher) that does not
+        accumulate state. Cheaper than a full re-boot when the same kernel
+        is reused across many runs.
+
+        Raises:
+            StateError: If the kernel has never been booted.
+        """
+        if self._config is None:
+            raise StateError("Kernel not booted")
+        self._state_machine = StateMachine(KernelState.BOOTING)
+        self._ledger = AuditLedger(self._config.kernel_id, self._config.variant)
+        # The runtime carries result and idempotency caches keyed by
+        # request id, so it is rebuilt rather than reused
+        self._runtime = KernelRuntime(
+            self._dispatcher,
+            now_ms=self._config.clock.now_ms,
+        )
+        self._nonce_registry = NonceRegistry()
+        self._pending_request = None
+        self._pending_decision = None
+        self._pending_result = None
+        self._state_machine.transition(KernelState.IDLE)
+
     def get_state(self) -> KernelState:
         """Get the current kernel state."""
         if self._state_machine is None:
@@ -381,6 +445,7 @@ class BaseKernel(Kernel):
                 request,
                 state_from,
                 f"Variant requirements not met: {'; '.join(variant_errors)}",
+                error_code=self._variant_denial_code(),
             )
 
         # Decide: ALLOW
@@ -527,13 +592,14 @@ class BaseKernel(Kernel):
         request: KernelRequest,
         state_from: KernelState,
         error: str,
+        error_code: Optional[ReceiptError] = None,
     ) -> KernelReceipt:
         """Create a DENY receipt and audit entry."""
         if self._state_machine is None or self._ledger is None:
             raise StateError("Kernel not booted")
 
         # Transition to AUDITING
-        if self._state_machine.state != KernelState.AUDITING:
+        if self._state_machine.state is not KernelState.AUDITING:
             self._state_machine.transition(KernelState.AUDITING)
 
         entry = self._ledger.append(
@@ -559,6 +625,7 @@ class BaseKernel(Kernel):
             decision=Decision.DENY,
             error=error,
             evidence_hash=entry.entry_hash,
+            error_code=error_code,
         )
 
     def _fail_request(
@@ -572,7 +639,7 @@ class BaseKernel(Kernel):
             raise StateError("Kernel not booted")
 
         # Transition to AUDITING
-        if self._state_machine.state != KernelState.AUDITING:
+        if self._state_machine.state is not KernelState.AUDITING:
             self._state_machine.transition(KernelState.AUDITING)
 
         entry = self._ledger.append(
@@ -604,9 +671,17 @@ class BaseKernel(Kernel):
         """Return whether strict ambiguity checking is enabled."""
         return True
 
-    def _check_variant_requirements(self, request: KernelRequest) -> list[str]:
+    def _check_variant_requirements(self, request: KernelRequest) -> Sequence[str]:
         """Check variant-specific requirements. Override in variants."""
-        return []
+        return _NO_ERRORS
+
+    def _variant_denial_code(self) -> Optional[ReceiptError]:
+        """Error code attached to variant-requirement denials.
+
+        Override in variants whose requirement failures map to a
+        machine-readable category.
+        """
+        return None
 
     def _requires_permit(self, request: KernelRequest) -> bool:
         """Determine if request requires a permit token.
@@ -655,7 +730,7 @@ class BaseKernel(Kernel):
             raise StateError("Kernel not booted")
 
         # Transition to AUDITING
-        if self._state_machine.state != KernelState.AUDITING:
+        if self._state_machine.state is not KernelState.AUDITING:
             self._state_machine.transition(KernelState.AUDITING)
 
         entry = self._ledger.append(
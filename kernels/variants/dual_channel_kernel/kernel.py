@@ -7,13 +7,84 @@ The dual-channel kernel requires both intent and constraints:
 - Produces richer receipts with constraint information
 """
 
-from kernels.common.types import KernelConfig, KernelRequest
+from typing import Any, Callable, Optional, Sequence
+
+from kernels.common.types import KernelRequest, ReceiptError
 from kernels.variants.base import BaseKernel
 
 
 REQUIRED_CONSTRAINT_KEYS = frozenset({"scope", "non_goals", "success_criteria"})
 
 
+def _make_constraint_validator(
+    required_keys: frozenset[str],
+) -> Callable[[Optional[dict[str, Any]]], list[str]]:
+    """Build a validator specialized over a fixed constraint schema.
+
+    The schema is folded into the closure once at import, so per-submit
+    validation runs against local cell variables instead of re-deriving
+    the key set and its sorted form on every call.
+
+    Args:
+        required_keys: Constraint keys every request must supply.
+
+    Returns:
+        Function mapping request params to a list of violation messages.
+    """
+    sorted_keys = tuple(sorted(required_keys))
+    full_mask = (1 << len(sorted_keys)) - 1
+
+    def _validate(params: Optional[dict[str, Any]]) -> list[str]:
+        if params is None:
+            return ["Params with constraints dict is required"]
+
+        constraints = params.get("constraints")
+        if constraints is None:
+            return ["Constraints dict is required in params"]
+
+        if not isinstance(constraints, dict):
+            return ["Constraints must be a dictionary"]
+
+        # Fast path: fold the per-key present-and-non-empty checks into
+        # one bitmask and compare against the full mask, so the common
+        # fully-constrained request takes a single branch and never
+        # builds the error machinery below
+        get = constraints.get
+        present = 0
+        for bit, key in enumerate(sorted_keys):
+            value = get(key)
+            if value is not None and (not isinstance(value, str) or value.strip()):
+                present |= 1 << bit
+        if present == full_mask:
+            return []
+
+        errors: list[str] = []
+
+        # The keys view is already set-like, so the set algebra runs in
+        # C without a rebuilt set
+        keys = constraints.keys()
+        missing_keys = required_keys - keys
+        if missing_keys:
+            ordered = [k for k in sorted_keys if k in missing_keys]
+            errors.append(
+                f"Missing required constraint keys: {', '.join(ordered)}"
+            )
+
+        # Validate present constraint values are not empty
+        for key in required_keys & keys:
+            value = constraints[key]
+            if value is None or (isinstance(value, str) and not value.strip()):
+                errors.append(f"Constraint '{key}' cannot be empty")
+
+        return errors
+
+    return _validate
+
+
+# One validator instance shared by every dual-channel kernel
+_VALIDATE_CONSTRAINTS = _make_constraint_validator(REQUIRED_CONSTRAINT_KEYS)
+
+
 class DualChannelKernel(BaseKernel):
     """Dual-channel kernel requiring intent and constraints.
 
@@ -24,57 +95,27 @@ class DualChannelKernel(BaseKernel):
     - Enables richer decision context through dual-channel input
     """
 
+    # All state lives in BaseKernel's slots
+    __slots__ = ()
+
     VARIANT_NAME = "dual-channel"
 
-    def boot(self, config: KernelConfig) -> None:
-        """Boot with dual-channel configuration."""
-        dual_config = KernelConfig(
-            kernel_id=config.kernel_id,
-            variant=self.VARIANT_NAME,
-            fail_closed=True,
-            require_jurisdiction=True,
-            require_audit=True,
-            clock=config.clock,
-            hash_alg=config.hash_alg,
-            max_param_bytes=config.max_param_bytes,
-            max_intent_length=config.max_intent_length,
-        )
-        super().boot(dual_config)
+    # Fields forced on every boot, built once at class load
+    _OVERLAY = {
+        "variant": VARIANT_NAME,
+        "fail_closed": True,
+        "require_jurisdiction": True,
+        "require_audit": True,
+    }
 
     def _is_strict_ambiguity(self) -> bool:
         """Dual-channel kernel uses strict ambiguity checking."""
         return True
 
-    def _check_variant_requirements(self, request: KernelRequest) -> list[str]:
+    def _check_variant_requirements(self, request: KernelRequest) -> Sequence[str]:
         """Dual-channel kernel requires constraints in params."""
-        errors = []
-
-        # Check for constraints in params
-        if request.params is None:
-            errors.append("Params with constraints dict is required")
-            return errors
-
-        constraints = request.params.get("constraints")
-        if constraints is None:
-            errors.append("Constraints dict is required in params")
-            return errors
+        return _VALIDATE_CONSTRAINTS(request.params)
 
-        if not isinstance(constraints, dict):
-            errors.append("Constraints must be a dictionary")
-            return errors
-
-        # Check for required constraint keys
-        missing_keys = REQUIRED_CONSTRAINT_KEYS - set(constraints.keys())
-        if missing_keys:
-            errors.append(
-                f"Missing required constraint keys: {', '.join(sorted(missing_keys))}"
-            )
-
-        # Validate constraint values are not empty
-        for key in REQUIRED_CONSTRAINT_KEYS:
-            if key in constraints:
-                value = constraints[key]
-                if value is None or (isinstance(value, str) and not value.strip()):
-                    errors.append(f"Constraint '{key}' cannot be empty")
-
-        return errors
+    def _variant_denial_code(self) -> Optional[ReceiptError]:
+        """Dual-channel denials all stem from constraint problems."""
+        return ReceiptError.MISSING_CONSTRAINTS
@@ -6,8 +6,10 @@ The evidence-first kernel requires evidence for ALLOW decisions:
 - Emphasizes audit and export capabilities
 """
 
-from kernels.common.types import KernelConfig, KernelRequest
-from kernels.variants.base import BaseKernel
+from typing import Optional, Sequence
+
+from kernels.common.types import KernelRequest, ReceiptError
+from kernels.variants.base import BaseKernel, _NO_ERRORS
 
 
 class EvidenceFirstKernel(BaseKernel):
@@ -20,35 +22,31 @@ class EvidenceFirstKernel(BaseKernel):
     - Emphasizes comprehensive audit trail
     """
 
+    # All state lives in BaseKernel's slots
+    __slots__ = ()
+
     VARIANT_NAME = "evidence-first"
 
-    def boot(self, config: KernelConfig) -> None:
-        """Boot with evidence-first configuration."""
-        evidence_config = KernelConfig(
-            kernel_id=config.kernel_id,
-            variant=self.VARIANT_NAME,
-            fail_closed=True,
-            require_jurisdiction=True,
-            require_audit=True,
-            clock=config.clock,
-            hash_alg=config.hash_alg,
-            max_param_bytes=config.max_param_bytes,
-            max_intent_length=config.max_intent_length,
-        )
-        super().boot(evidence_config)
+    # Fields forced on every boot, built once at class load
+    _OVERLAY = {
+        "variant": VARIANT_NAME,
+        "fail_closed": True,
+        "require_jurisdiction": True,
+        "require_audit": True,
+    }
 
     def _is_strict_ambiguity(self) -> bool:
         """Evidence-first kernel uses strict ambiguity checking."""
         return True
 
-    def _check_variant_requirements(self, request: KernelRequest) -> list[str]:
+    def _check_variant_requirements(self, request: KernelRequest) -> Sequence[str]:
         """Evidence-first kernel requires evidence field."""
-        errors = []
-
-        # Evidence is required for all requests
-        if request.evidence is None:
-            errors.append("Evidence field is required for this kernel variant")
-        elif not request.evidence.strip():
-            errors.append("Evidence field cannot be empty")
-
-        return errors
+        # (evidence or "") folds the None case into the blank-string
+        # case, leaving a single truthiness branch on the allow path
+        if not (request.evidence or "").strip():
+            return ["Evidence field is required and must be non-empty"]
+        return _NO_ERRORS
+
+    def _variant_denial_code(self) -> Optional[ReceiptError]:
+        """Evidence-first denials all stem from missing evidence."""
+        return ReceiptError.MISSING_EVIDENCE
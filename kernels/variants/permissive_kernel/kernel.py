@@ -6,12 +6,11 @@ The permissive kernel has relaxed constraints:
 - Audits and returns ALLOW without executing tools for intent-only requests
 """
 
-from kernels.common.types import (
-    KernelConfig,
-    KernelRequest,
-)
+from typing import Sequence
+
+from kernels.common.types import KernelRequest
 from kernels.jurisdiction.policy import JurisdictionPolicy
-from kernels.variants.base import BaseKernel
+from kernels.variants.base import BaseKernel, _NO_ERRORS
 
 
 class PermissiveKernel(BaseKernel):
@@ -24,39 +23,37 @@ class PermissiveKernel(BaseKernel):
     - Still maintains audit trail for all operations
     """
 
+    # All state lives in BaseKernel's slots
+    __slots__ = ()
+
     VARIANT_NAME = "permissive"
 
+    # Fields forced on every boot, built once at class load
+    _OVERLAY = {
+        "variant": VARIANT_NAME,
+        "max_intent_length": 8192,  # More permissive
+    }
+
+    # JurisdictionPolicy is frozen, so one instance is safely shared
+    # across all permissive kernels instead of rebuilt per __init__
+    _PERMISSIVE_POLICY = JurisdictionPolicy(
+        allowed_actors=frozenset({"*"}),
+        allowed_tools=frozenset({"*"}),
+        allow_intent_only=True,
+        max_intent_length=8192,  # More permissive
+    )
+
     def __init__(self) -> None:
         """Initialize permissive kernel."""
         super().__init__()
         # Set permissive policy
-        self._policy = JurisdictionPolicy(
-            allowed_actors=frozenset({"*"}),
-            allowed_tools=frozenset({"*"}),
-            allow_intent_only=True,
-            max_intent_length=8192,  # More permissive
-        )
-
-    def boot(self, config: KernelConfig) -> None:
-        """Boot with permissive configuration."""
-        permissive_config = KernelConfig(
-            kernel_id=config.kernel_id,
-            variant=self.VARIANT_NAME,
-            fail_closed=config.fail_closed,
-            require_jurisdiction=config.require_jurisdiction,
-            require_audit=config.require_audit,
-            clock=config.clock,
-            hash_alg=config.hash_alg,
-            max_param_bytes=config.max_param_bytes,
-            max_intent_length=8192,  # More permissive
-        )
-        super().boot(permissive_config)
+        self._policy = self._PERMISSIVE_POLICY
 
     def _is_strict_ambiguity(self) -> bool:
         """Permissive kernel uses relaxed ambiguity checking."""
         return False
 
-    def _check_variant_requirements(self, request: KernelRequest) -> list[str]:
+    def _check_variant_requirements(self, request: KernelRequest) -> Sequence[str]:
         """Permissive kernel allows intent-only requests."""
         # No additional requirements - intent-only is allowed
-        return []
+        return _NO_ERRORS
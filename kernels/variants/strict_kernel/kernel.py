@@ -7,8 +7,15 @@ The strict kernel enforces maximum constraints:
 - tool execution only if tool_call present and validated
 """
 
-from kernels.common.types import KernelConfig, KernelRequest
-from kernels.variants.base import BaseKernel
+from typing import Optional, Sequence
+
+from kernels.common.types import KernelReceipt, KernelRequest, KernelState
+from kernels.permits import PermitToken
+from kernels.variants.base import BaseKernel, _NO_ERRORS
+
+
+# Matches the message the full ambiguity walk produces for this case
+_EMPTY_INTENT_DENIAL = "Ambiguity detected: Empty intent is ambiguous"
 
 
 class StrictKernel(BaseKernel):
@@ -22,28 +29,53 @@ class StrictKernel(BaseKernel):
     - Only executes tools when tool_call is explicitly provided
     """
 
+    # All state lives in BaseKernel's slots
+    __slots__ = ()
+
     VARIANT_NAME = "strict"
 
-    def boot(self, config: KernelConfig) -> None:
-        """Boot with strict configuration enforcement."""
-        # Enforce strict settings
-        strict_config = KernelConfig(
-            kernel_id=config.kernel_id,
-            variant=self.VARIANT_NAME,
-            fail_closed=True,  # Always true for strict
-            require_jurisdiction=True,  # Always true for strict
-            require_audit=True,  # Always true for strict
-            clock=config.clock,
-            hash_alg=config.hash_alg,
-            max_param_bytes=config.max_param_bytes,
-            max_intent_length=config.max_intent_length,
-        )
-        super().boot(strict_config)
+    # Fields forced on every boot, built once at class load
+    _OVERLAY = {
+        "variant": VARIANT_NAME,
+        "fail_closed": True,  # Always true for strict
+        "require_jurisdiction": True,  # Always true for strict
+        "require_audit": True,  # Always true for strict
+    }
+
+    def submit(
+        self, request: KernelRequest, permit_token: Optional[PermitToken] = None
+    ) -> KernelReceipt:
+        """Submit a request, short-circuiting empty-intent denials.
+
+        An otherwise well-formed request with an empty intent can never
+        pass the strict ambiguity gate, so it is denied without running
+        the full validation and ambiguity walks. The denial still flows
+        through the normal state transitions and audit append, producing
+        a receipt identical to the slow path's.
+        """
+        if (
+            request.intent == ""
+            and request.tool_call is None
+            and isinstance(request.request_id, str)
+            and request.request_id
+            and isinstance(request.actor, str)
+            and request.actor
+            and isinstance(request.ts_ms, int)
+            and request.ts_ms >= 0
+            and (request.params is None or isinstance(request.params, dict))
+            and self._state_machine is not None
+        ):
+            self._state_machine.assert_not_halted()
+            self._state_machine.assert_state(KernelState.IDLE)
+            state_from = self._state_machine.state
+            self._state_machine.transition(KernelState.VALIDATING)
+            return self._deny_request(request, state_from, _EMPTY_INTENT_DENIAL)
+        return super().submit(request, permit_token)
 
     def _is_strict_ambiguity(self) -> bool:
         """Strict kernel uses strict ambiguity checking."""
         return True
 
-    def _check_variant_requirements(self, request: KernelRequest) -> list[str]:
+    def _check_variant_requirements(self, request: KernelRequest) -> Sequence[str]:
         """Strict kernel has no additional requirements beyond base."""
-        return []
+        return _NO_ERRORS
@@ -2,6 +2,7 @@
 
 import unittest
 
+from kernels.common.codec import serialize_deterministic
 from kernels.common.hashing import (
     compute_hash,
     compute_hash_str,
@@ -41,6 +42,42 @@ class TestHashing(unittest.TestCase):
         hash2 = compute_hash_dict(dict2)
         self.assertEqual(hash1, hash2)
 
+    def test_compute_hash_dict_matches_json_canonical(self) -> None:
+        """Dict hashing matches the canonical JSON serialization."""
+        cases = (
+            {"a": 1, "b": "two"},
+            {"intent": "café ☃"},
+            # DEL passes isascii() but the encoders escape it differently
+            {"intent": "run\x7fjob"},
+            # Floats: the encoders disagree on exponent formatting
+            {"threshold": 1e-7, "scale": 1e16, "tiny": 1e-05},
+            {"nested": {"values": [0.1, 2.5e-8]}},
+            # Non-finite floats: stdlib emits NaN/Infinity, orjson null
+            {"nan": float("nan"), "inf": float("inf")},
+        )
+        for data in cases:
+            expected = compute_hash(
+                serialize_deterministic(data).encode("utf-8")
+            )
+            self.assertEqual(compute_hash_dict(data), expected)
+
+    def test_compute_hash_dict_msgpack(self) -> None:
+        """Msgpack canonicalization is deterministic and distinct."""
+        try:
+            import msgpack  # noqa: F401
+        except ImportError:
+            self.skipTest("msgpack not installed")
+
+        dict1 = {"b": {"y": 2, "x": 1}, "a": 1}
+        dict2 = {"a": 1, "b": {"x": 1, "y": 2}}
+
+        hash1 = compute_hash_dict(dict1, algorithm="sha256-msgpack")
+        hash2 = compute_hash_dict(dict2, algorithm="sha256-msgpack")
+
+        self.assertEqual(hash1, hash2)
+        # Opt-in algorithm produces different digests than the JSON form
+        self.assertNotEqual(hash1, compute_hash_dict(dict1))
+
     def test_compute_chain_hash(self) -> None:
         """Chain hash combines prev_hash and entry_data."""
         prev = genesis_hash()
@@ -10,6 +10,7 @@ from kernels.jurisdiction.rules import (
     check_required_fields,
     check_param_size,
     evaluate_policy,
+    evaluate_policy_batch,
 )
 
 
@@ -160,6 +161,24 @@ class TestJurisdictionRules(unittest.TestCase):
         self.assertFalse(result.allowed)
         self.assertTrue(len(result.violations) > 0)
 
+    def test_evaluate_policy_batch_matches_single(self) -> None:
+        """Batch evaluation matches per-request evaluation."""
+        denied_request = KernelRequest(
+            request_id="req-002",
+            ts_ms=1000,
+            actor="bob",
+            intent="test",
+        )
+        requests = [self.valid_request, denied_request]
+
+        batch_results = evaluate_policy_batch(requests, self.policy)
+        single_results = [evaluate_policy(r, self.policy) for r in requests]
+
+        self.assertEqual(len(batch_results), 2)
+        for batch, single in zip(batch_results, single_results):
+            self.assertEqual(batch.allowed, single.allowed)
+            self.assertEqual(batch.violations, single.violations)
+
 
 if __name__ == "__main__":
     unittest.main()
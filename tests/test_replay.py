@@ -10,9 +10,26 @@ from kernels.audit.replay import replay_and_verify, verify_evidence_bundle
 class TestReplay(unittest.TestCase):
     """Test cases for replay verification."""
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Build a canonical 5-entry ledger once for the whole class."""
+        cls._base = AuditLedger("test-kernel", "strict")
+        for i in range(5):
+            cls._base.append(
+                request_id=f"req-{i:03d}",
+                actor="alice",
+                intent=f"intent {i}",
+                decision=Decision.ALLOW,
+                state_from=KernelState.IDLE,
+                state_to=KernelState.IDLE,
+                ts_ms=1000 + i,
+            )
+
     def setUp(self) -> None:
-        """Set up test fixtures."""
-        self.ledger = AuditLedger("test-kernel", "strict")
+        """Set up test fixtures from the shared base ledger."""
+        # clone() shares the immutable entries without recomputing the
+        # hash chain; to_list() below yields fresh mutable dicts
+        self.ledger = self._base.clone()
 
     def test_empty_ledger_valid(self) -> None:
         """Empty ledger is valid."""
@@ -21,18 +38,8 @@ class TestReplay(unittest.TestCase):
         self.assertEqual(errors, [])
 
     def test_single_entry_valid(self) -> None:
-        """Single entry ledger verifies correctly."""
-        self.ledger.append(
-            request_id="req-001",
-            actor="alice",
-            intent="test",
-            decision=Decision.ALLOW,
-            state_from=KernelState.IDLE,
-            state_to=KernelState.IDLE,
-            ts_ms=1000,
-        )
-
-        entries = self.ledger.to_list()
+        """A single-entry chain prefix verifies correctly."""
+        entries = self.ledger.to_list()[:1]
         is_valid, errors = replay_and_verify(entries)
 
         self.assertTrue(is_valid)
@@ -40,17 +47,6 @@ class TestReplay(unittest.TestCase):
 
     def test_multi_entry_valid(self) -> None:
         """Multi-entry ledger verifies correctly."""
-        for i in range(5):
-            self.ledger.append(
-                request_id=f"req-{i:03d}",
-                actor="alice",
-                intent=f"intent {i}",
-                decision=Decision.ALLOW,
-                state_from=KernelState.IDLE,
-                state_to=KernelState.IDLE,
-                ts_ms=1000 + i,
-            )
-
         entries = self.ledger.to_list()
         is_valid, errors = replay_and_verify(entries)
 
@@ -59,16 +55,6 @@ class TestReplay(unittest.TestCase):
 
     def test_tampered_entry_detected(self) -> None:
         """Tampered entry is detected."""
-        self.ledger.append(
-            request_id="req-001",
-            actor="alice",
-            intent="test",
-            decision=Decision.ALLOW,
-            state_from=KernelState.IDLE,
-            state_to=KernelState.IDLE,
-            ts_ms=1000,
-        )
-
         entries = self.ledger.to_list()
         entries[0]["intent"] = "tampered intent"
 
@@ -79,17 +65,6 @@ class TestReplay(unittest.TestCase):
 
     def test_broken_chain_detected(self) -> None:
         """Broken hash chain is detected."""
-        for i in range(3):
-            self.ledger.append(
-                request_id=f"req-{i:03d}",
-                actor="alice",
-                intent=f"intent {i}",
-                decision=Decision.ALLOW,
-                state_from=KernelState.IDLE,
-                state_to=KernelState.IDLE,
-                ts_ms=1000 + i,
-            )
-
         entries = self.ledger.to_list()
         entries[1]["prev_hash"] = "0" * 64  # Break the chain
 
@@ -98,18 +73,26 @@ class TestReplay(unittest.TestCase):
         self.assertFalse(is_valid)
         self.assertTrue(len(errors) > 0)
 
-    def test_verify_evidence_bundle(self) -> None:
-        """Evidence bundle verification works."""
+    def test_clone_appends_independently(self) -> None:
+        """Appending to a clone does not affect the base ledger."""
         self.ledger.append(
-            request_id="req-001",
+            request_id="req-extra",
             actor="alice",
-            intent="test",
+            intent="extra",
             decision=Decision.ALLOW,
             state_from=KernelState.IDLE,
             state_to=KernelState.IDLE,
-            ts_ms=1000,
+            ts_ms=2000,
         )
 
+        self.assertEqual(self.ledger.length, 6)
+        self.assertEqual(self._base.length, 5)
+        is_valid, errors = replay_and_verify(self.ledger.to_list())
+        self.assertTrue(is_valid)
+        self.assertEqual(errors, [])
+
+    def test_verify_evidence_bundle(self) -> None:
+        """Evidence bundle verification works."""
         bundle = self.ledger.export(2000)
         bundle_dict = {
             "ledger_entries": self.ledger.to_list(),
@@ -122,21 +105,11 @@ class TestReplay(unittest.TestCase):
         result = verify_evidence_bundle(bundle_dict)
 
         self.assertTrue(result.is_valid)
-        self.assertEqual(result.entries_verified, 1)
+        self.assertEqual(result.entries_verified, 5)
         self.assertEqual(result.errors, [])
 
     def test_root_hash_mismatch(self) -> None:
         """Root hash mismatch is detected."""
-        self.ledger.append(
-            request_id="req-001",
-            actor="alice",
-            intent="test",
-            decision=Decision.ALLOW,
-            state_from=KernelState.IDLE,
-            state_to=KernelState.IDLE,
-            ts_ms=1000,
-        )
-
         entries = self.ledger.to_list()
         is_valid, errors = replay_and_verify(entries, expected_root_hash="wrong_hash")
 
@@ -0,0 +1,49 @@
+"""Tests for SDK server request decoding."""
+
+import unittest
+
+
+class TestRequestDecoding(unittest.TestCase):
+    """Test cases for the /submit payload schema."""
+
+    def test_msgspec_decode_builds_kernel_request(self) -> None:
+        """Decoded msgspec payloads map onto KernelRequest fields."""
+        try:
+            import msgspec  # noqa: F401
+        except ImportError:
+            self.skipTest("msgspec not installed")
+
+        from kernels.sdk import server
+
+        body = (
+            b'{"request_id":"req-001","ts_ms":1000,"actor":"alice",'
+            b'"intent":"deploy service","tool_call":{"name":"deploy",'
+            b'"params":{"env":"prod"}},"constraints":{"max_cost":10}}'
+        )
+        request = server._request_from_msg(server._REQUEST_DECODER.decode(body))
+
+        self.assertEqual(request.request_id, "req-001")
+        self.assertEqual(request.ts_ms, 1000)
+        self.assertEqual(request.actor, "alice")
+        self.assertEqual(request.intent, "deploy service")
+        self.assertEqual(request.tool_call.name, "deploy")
+        self.assertEqual(request.tool_call.params, {"env": "prod"})
+        # Top-level constraints are folded into params
+        self.assertEqual(request.params, {"constraints": {"max_cost": 10}})
+
+    def test_msgspec_decode_requires_ts_ms(self) -> None:
+        """Payloads missing ts_ms are rejected at decode time."""
+        try:
+            import msgspec
+        except ImportError:
+            self.skipTest("msgspec not installed")
+
+        from kernels.sdk import server
+
+        body = b'{"request_id":"req-001","actor":"alice","intent":"deploy"}'
+        with self.assertRaises(msgspec.ValidationError):
+            server._REQUEST_DECODER.decode(body)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,12 +4,19 @@ import unittest
 
 from kernels.common.types import KernelState
 from kernels.common.errors import StateError
+from kernels.state._minimize import (
+    compute_equivalence_classes,
+    report_equivalent_states,
+)
 from kernels.state.machine import StateMachine
 from kernels.state.transitions import (
+    ALLOWED_TRANSITIONS,
     can_transition,
     get_next_states,
+    is_reachable,
     is_terminal,
     validate_transition_path,
+    validate_transition_paths_bulk,
 )
 
 
@@ -42,6 +49,14 @@ class TestTransitions(unittest.TestCase):
         self.assertIn(KernelState.VALIDATING, next_states)
         self.assertIn(KernelState.HALTED, next_states)
 
+    def test_is_reachable_multi_hop(self) -> None:
+        """EXECUTING is reachable from BOOTING through multiple hops."""
+        self.assertTrue(is_reachable(KernelState.BOOTING, KernelState.EXECUTING))
+
+    def test_is_reachable_from_terminal(self) -> None:
+        """Nothing is reachable from HALTED."""
+        self.assertFalse(is_reachable(KernelState.HALTED, KernelState.IDLE))
+
     def test_validate_transition_path_valid(self) -> None:
         """Valid path validates successfully."""
         path = [
@@ -64,6 +79,56 @@ class TestTransitions(unittest.TestCase):
         self.assertFalse(is_valid)
         self.assertIsNotNone(error)
 
+    def test_validate_transition_paths_bulk(self) -> None:
+        """Bulk validator agrees with the per-path validator."""
+        try:
+            import numpy as np  # noqa: F401
+        except ImportError:
+            self.skipTest("numpy not installed")
+
+        index = {state: i for i, state in enumerate(KernelState)}
+        valid_path = [
+            KernelState.BOOTING,
+            KernelState.IDLE,
+            KernelState.VALIDATING,
+            KernelState.ARBITRATING,
+        ]
+        invalid_path = [
+            KernelState.BOOTING,
+            KernelState.EXECUTING,  # Invalid edge
+            KernelState.AUDITING,
+            KernelState.IDLE,
+        ]
+        paths = np.array(
+            [
+                [index[state] for state in valid_path],
+                [index[state] for state in invalid_path],
+            ],
+            dtype=np.int16,
+        )
+
+        results = validate_transition_paths_bulk(paths)
+
+        self.assertTrue(bool(results[0]))
+        self.assertFalse(bool(results[1]))
+
+
+class TestMinimization(unittest.TestCase):
+    """Test cases for FSM minimization analysis."""
+
+    def test_no_equivalent_states_with_role_labels(self) -> None:
+        """With per-state labels, no kernel states are redundant."""
+        merged = report_equivalent_states(ALLOWED_TRANSITIONS)
+        self.assertEqual(merged, [])
+
+    def test_pure_transition_equivalence_merges(self) -> None:
+        """Without labels, states with identical behavior merge."""
+        classes = compute_equivalence_classes(ALLOWED_TRANSITIONS)
+        # Terminal HALTED is always alone in its class
+        self.assertIn(frozenset({KernelState.HALTED}), classes)
+        # The unlabeled FSM has fewer classes than states
+        self.assertLess(len(classes), len(ALLOWED_TRANSITIONS))
+
 
 class TestStateMachine(unittest.TestCase):
     """Test cases for StateMachine class."""
@@ -71,14 +136,14 @@ class TestStateMachine(unittest.TestCase):
     def test_initial_state(self) -> None:
         """Machine starts in BOOTING state."""
         machine = StateMachine()
-        self.assertEqual(machine.state, KernelState.BOOTING)
+        self.assertIs(machine.state, KernelState.BOOTING)
 
     def test_transition(self) -> None:
         """Valid transition updates state."""
         machine = StateMachine()
         prev = machine.transition(KernelState.IDLE)
-        self.assertEqual(prev, KernelState.BOOTING)
-        self.assertEqual(machine.state, KernelState.IDLE)
+        self.assertIs(prev, KernelState.BOOTING)
+        self.assertIs(machine.state, KernelState.IDLE)
 
     def test_invalid_transition_raises(self) -> None:
         """Invalid transition raises StateError."""
@@ -91,7 +156,7 @@ class TestStateMachine(unittest.TestCase):
         machine = StateMachine()
         machine.transition(KernelState.IDLE)
         machine.halt()
-        self.assertEqual(machine.state, KernelState.HALTED)
+        self.assertIs(machine.state, KernelState.HALTED)
         self.assertTrue(machine.is_halted)
 
     def test_halt_from_terminal_raises(self) -> None:
@@ -120,12 +185,28 @@ class TestStateMachine(unittest.TestCase):
         with self.assertRaises(StateError):
             machine.assert_state(KernelState.IDLE)
 
+    def test_pack_unpack_roundtrip(self) -> None:
+        """Packed snapshot restores state and transition count."""
+        machine = StateMachine()
+        machine.transition(KernelState.IDLE)
+        machine.transition(KernelState.VALIDATING)
+
+        restored = StateMachine.unpack(machine.pack())
+
+        self.assertIs(restored.state, KernelState.VALIDATING)
+        self.assertEqual(restored.transition_count, 2)
+
+    def test_unpack_invalid_snapshot_raises(self) -> None:
+        """Malformed snapshot raises StateError."""
+        with self.assertRaises(StateError):
+            StateMachine.unpack(b"\x00")
+
     def test_reset(self) -> None:
         """Reset returns machine to initial state."""
         machine = StateMachine()
         machine.transition(KernelState.IDLE)
         machine.reset()
-        self.assertEqual(machine.state, KernelState.BOOTING)
+        self.assertIs(machine.state, KernelState.BOOTING)
         self.assertEqual(machine.transition_count, 0)
 
 
@@ -1,5 +1,6 @@
 """Tests for kernel variants."""
 
+import sys
 import unittest
 
 from kernels.common.types import (
@@ -7,14 +8,34 @@ from kernels.common.types import (
     KernelConfig,
     KernelRequest,
     KernelState,
+    ReceiptError,
     ReceiptStatus,
     ToolCall,
     VirtualClock,
 )
-from kernels.variants.strict_kernel import StrictKernel
-from kernels.variants.permissive_kernel import PermissiveKernel
-from kernels.variants.evidence_first_kernel import EvidenceFirstKernel
-from kernels.variants.dual_channel_kernel import DualChannelKernel
+# Variant modules are imported inside each setUpClass so a filtered run
+# (e.g. pytest -k StrictKernel) only pays for the kernels it exercises
+
+
+# One clock shared by every config: none of these tests advance time,
+# so a single instance avoids re-allocating a clock per setUp
+_CLOCK = VirtualClock(1000)
+
+# Shared request fields: interned short strings compare by identity in
+# kernel validation, and the long payload is allocated once per run
+_REQ_ID = sys.intern("req-001")
+_ALICE = sys.intern("alice")
+_INTENT = sys.intern("test intent")
+_LONG_INTENT = "x" * 5000  # Longer than strict default
+
+# Template for the request fields nearly every test repeats; tests
+# override only the fields they exercise
+_TEMPLATE = dict(request_id=_REQ_ID, ts_ms=1000, actor=_ALICE, intent=_INTENT)
+
+
+def _make_req(**overrides: object) -> KernelRequest:
+    """Build a KernelRequest from the shared template plus overrides."""
+    return KernelRequest(**{**_TEMPLATE, **overrides})
 
 
 def make_config(kernel_id: str, variant: str) -> KernelConfig:
@@ -22,65 +43,70 @@ def make_config(kernel_id: str, variant: str) -> KernelConfig:
     return KernelConfig(
         kernel_id=kernel_id,
         variant=variant,
-        clock=VirtualClock(1000),
+        clock=_CLOCK,
     )
 
 
 class TestStrictKernel(unittest.TestCase):
     """Test cases for StrictKernel."""
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Boot one shared kernel for the class."""
+        from kernels.variants.strict_kernel import StrictKernel
+
+        cls.kernel = StrictKernel()
+        cls.kernel.boot(make_config("strict-001", "strict"))
+
     def setUp(self) -> None:
-        """Set up test fixtures."""
-        self.kernel = StrictKernel()
-        self.kernel.boot(make_config("strict-001", "strict"))
+        """Reset the shared kernel between tests."""
+        self.kernel.reset()
 
     def test_boot_state(self) -> None:
         """Kernel boots to IDLE state."""
-        self.assertEqual(self.kernel.get_state(), KernelState.IDLE)
+        self.assertIs(self.kernel.get_state(), KernelState.IDLE)
 
     def test_valid_request_allowed(self) -> None:
         """Valid request with tool_call is allowed."""
-        request = KernelRequest(
-            request_id="req-001",
-            ts_ms=1000,
-            actor="alice",
+        request = _make_req(
             intent="echo test",
             tool_call=ToolCall(name="echo", params={"text": "hello"}),
         )
 
         receipt = self.kernel.submit(request)
 
-        self.assertEqual(receipt.status, ReceiptStatus.ACCEPTED)
-        self.assertEqual(receipt.decision, Decision.ALLOW)
+        self.assertIs(receipt.status, ReceiptStatus.ACCEPTED)
+        self.assertIs(receipt.decision, Decision.ALLOW)
         self.assertEqual(receipt.tool_result, "hello")
 
     def test_empty_intent_denied(self) -> None:
         """Empty intent is denied."""
-        request = KernelRequest(
-            request_id="req-001",
-            ts_ms=1000,
-            actor="alice",
-            intent="",
-        )
+        request = _make_req(intent="")
 
         receipt = self.kernel.submit(request)
 
-        self.assertEqual(receipt.status, ReceiptStatus.REJECTED)
-        self.assertEqual(receipt.decision, Decision.DENY)
+        self.assertIs(receipt.status, ReceiptStatus.REJECTED)
+        self.assertIs(receipt.decision, Decision.DENY)
 
     def test_halt(self) -> None:
         """Kernel can be halted."""
         receipt = self.kernel.halt("test halt")
 
-        self.assertEqual(self.kernel.get_state(), KernelState.HALTED)
-        self.assertEqual(receipt.decision, Decision.HALT)
+        self.assertIs(self.kernel.get_state(), KernelState.HALTED)
+        self.assertIs(receipt.decision, Decision.HALT)
+
+    def test_reset_restores_idle(self) -> None:
+        """Reset recovers a halted kernel with an empty ledger."""
+        self.kernel.halt("test halt")
+
+        self.kernel.reset()
+
+        self.assertIs(self.kernel.get_state(), KernelState.IDLE)
+        self.assertEqual(len(self.kernel.export_evidence().ledger_entries), 0)
 
     def test_export_evidence(self) -> None:
         """Evidence can be exported."""
-        request = KernelRequest(
-            request_id="req-001",
-            ts_ms=1000,
-            actor="alice",
+        request = _make_req(
             intent="test",
             tool_call=ToolCall(name="echo", params={"text": "hi"}),
         )
@@ -95,144 +121,126 @@ class TestStrictKernel(unittest.TestCase):
 class TestPermissiveKernel(unittest.TestCase):
     """Test cases for PermissiveKernel."""
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Boot one shared kernel for the class."""
+        from kernels.variants.permissive_kernel import PermissiveKernel
+
+        cls.kernel = PermissiveKernel()
+        cls.kernel.boot(make_config("permissive-001", "permissive"))
+
     def setUp(self) -> None:
-        """Set up test fixtures."""
-        self.kernel = PermissiveKernel()
-        self.kernel.boot(make_config("permissive-001", "permissive"))
+        """Reset the shared kernel between tests."""
+        self.kernel.reset()
 
     def test_intent_only_allowed(self) -> None:
         """Intent-only request is allowed."""
-        request = KernelRequest(
-            request_id="req-001",
-            ts_ms=1000,
-            actor="alice",
-            intent="just an intent, no tool",
-        )
+        request = _make_req(intent="just an intent, no tool")
 
         receipt = self.kernel.submit(request)
 
-        self.assertEqual(receipt.status, ReceiptStatus.ACCEPTED)
-        self.assertEqual(receipt.decision, Decision.ALLOW)
+        self.assertIs(receipt.status, ReceiptStatus.ACCEPTED)
+        self.assertIs(receipt.decision, Decision.ALLOW)
 
     def test_longer_intent_allowed(self) -> None:
         """Longer intents are allowed in permissive mode."""
-        long_intent = "x" * 5000  # Longer than strict default
-
-        request = KernelRequest(
-            request_id="req-001",
-            ts_ms=1000,
-            actor="alice",
-            intent=long_intent,
-        )
+        request = _make_req(intent=_LONG_INTENT)
 
         receipt = self.kernel.submit(request)
 
-        self.assertEqual(receipt.status, ReceiptStatus.ACCEPTED)
+        self.assertIs(receipt.status, ReceiptStatus.ACCEPTED)
 
 
 class TestEvidenceFirstKernel(unittest.TestCase):
     """Test cases for EvidenceFirstKernel."""
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Boot one shared kernel for the class."""
+        from kernels.variants.evidence_first_kernel import EvidenceFirstKernel
+
+        cls.kernel = EvidenceFirstKernel()
+        cls.kernel.boot(make_config("evidence-001", "evidence-first"))
+
     def setUp(self) -> None:
-        """Set up test fixtures."""
-        self.kernel = EvidenceFirstKernel()
-        self.kernel.boot(make_config("evidence-001", "evidence-first"))
+        """Reset the shared kernel between tests."""
+        self.kernel.reset()
 
     def test_missing_evidence_denied(self) -> None:
         """Request without evidence is denied."""
-        request = KernelRequest(
-            request_id="req-001",
-            ts_ms=1000,
-            actor="alice",
-            intent="test intent",
-        )
+        request = _make_req()
 
         receipt = self.kernel.submit(request)
 
-        self.assertEqual(receipt.status, ReceiptStatus.REJECTED)
-        self.assertEqual(receipt.decision, Decision.DENY)
-        self.assertIn("Evidence", receipt.error)
+        self.assertIs(receipt.status, ReceiptStatus.REJECTED)
+        self.assertIs(receipt.decision, Decision.DENY)
+        self.assertIs(receipt.error_code, ReceiptError.MISSING_EVIDENCE)
 
     def test_with_evidence_allowed(self) -> None:
         """Request with evidence is allowed."""
-        request = KernelRequest(
-            request_id="req-001",
-            ts_ms=1000,
-            actor="alice",
-            intent="test intent",
-            evidence="This is the evidence for this request",
-        )
+        request = _make_req(evidence="This is the evidence for this request")
 
         receipt = self.kernel.submit(request)
 
-        self.assertEqual(receipt.status, ReceiptStatus.ACCEPTED)
-        self.assertEqual(receipt.decision, Decision.ALLOW)
+        self.assertIs(receipt.status, ReceiptStatus.ACCEPTED)
+        self.assertIs(receipt.decision, Decision.ALLOW)
 
 
 class TestDualChannelKernel(unittest.TestCase):
     """Test cases for DualChannelKernel."""
 
-    def setUp(self) -> None:
-        """Set up test fixtures."""
-        self.kernel = DualChannelKernel()
-        self.kernel.boot(make_config("dual-001", "dual-channel"))
-
-    def test_missing_constraints_denied(self) -> None:
-        """Request without constraints is denied."""
-        request = KernelRequest(
-            request_id="req-001",
-            ts_ms=1000,
-            actor="alice",
-            intent="test intent",
-            params={},
-        )
-
-        receipt = self.kernel.submit(request)
-
-        self.assertEqual(receipt.status, ReceiptStatus.REJECTED)
-        self.assertEqual(receipt.decision, Decision.DENY)
-        self.assertIn("constraints", receipt.error.lower())
-
-    def test_partial_constraints_denied(self) -> None:
-        """Request with partial constraints is denied."""
-        request = KernelRequest(
-            request_id="req-001",
-            ts_ms=1000,
-            actor="alice",
-            intent="test intent",
-            params={
-                "constraints": {
-                    "scope": "test scope",
-                    # Missing non_goals and success_criteria
-                }
-            },
-        )
-
-        receipt = self.kernel.submit(request)
-
-        self.assertEqual(receipt.status, ReceiptStatus.REJECTED)
-        self.assertEqual(receipt.decision, Decision.DENY)
-
-    def test_full_constraints_allowed(self) -> None:
-        """Request with full constraints is allowed."""
-        request = KernelRequest(
-            request_id="req-001",
-            ts_ms=1000,
-            actor="alice",
-            intent="test intent",
-            params={
-                "constraints": {
-                    "scope": "test scope",
-                    "non_goals": "things we will not do",
-                    "success_criteria": "how we measure success",
-                }
-            },
-        )
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Boot one shared kernel for the class."""
+        from kernels.variants.dual_channel_kernel import DualChannelKernel
 
-        receipt = self.kernel.submit(request)
+        cls.kernel = DualChannelKernel()
+        cls.kernel.boot(make_config("dual-001", "dual-channel"))
 
-        self.assertEqual(receipt.status, ReceiptStatus.ACCEPTED)
-        self.assertEqual(receipt.decision, Decision.ALLOW)
+    def setUp(self) -> None:
+        """Reset the shared kernel between tests."""
+        self.kernel.reset()
+
+    def test_constraint_cases(self) -> None:
+        """Submissions are accepted only when all constraints are present."""
+        cases = [
+            ("missing", {}, ReceiptStatus.REJECTED),
+            (
+                "partial",
+                {
+                    "constraints": {
+                        "scope": "test scope",
+                        # Missing non_goals and success_criteria
+                    }
+                },
+                ReceiptStatus.REJECTED,
+            ),
+            (
+                "full",
+                {
+                    "constraints": {
+                        "scope": "test scope",
+                        "non_goals": "things we will not do",
+                        "success_criteria": "how we measure success",
+                    }
+                },
+                ReceiptStatus.ACCEPTED,
+            ),
+        ]
+
+        for label, params, expected in cases:
+            with self.subTest(constraints=label):
+                receipt = self.kernel.submit(_make_req(params=params))
+
+                self.assertIs(receipt.status, expected)
+                if expected is ReceiptStatus.REJECTED:
+                    self.assertIs(receipt.decision, Decision.DENY)
+                    self.assertIs(
+                        receipt.error_code, ReceiptError.MISSING_CONSTRAINTS
+                    )
+                else:
+                    self.assertIs(receipt.decision, Decision.ALLOW)
+                self.kernel.reset()
 
 
 if __name__ == "__main__":